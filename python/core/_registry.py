@@ -0,0 +1,198 @@
+# Copyright 2019 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module-level state and implementation backing the Tink Registry."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import google_type_annotations
+from __future__ import print_function
+
+from typing import Any, Text, Tuple, Type, TypeVar
+
+from tink.proto import tink_pb2
+from tink.python.core import key_manager as km_module
+from tink.python.core import primitive_set as pset_module
+from tink.python.core import primitive_wrapper
+from tink.python.core import tink_error
+
+P = TypeVar('P')
+
+_MISSING = object()
+
+# Whether register_primitive_wrapper() sanity-checks the wrapper on an empty
+# PrimitiveSet. Off under 'python -O' to keep it off the import path.
+_VALIDATE_WRAPPERS = __debug__
+
+# Maps type URLs to (key manager, new_key_allowed, primitive class) triples.
+# The primitive class is cached at registration so that primitive() does not
+# have to call key_manager.primitive_class() on every invocation.
+_KEY_MANAGERS = {}  # type: dict[Text, Tuple[km_module.KeyManager, bool, Type]]
+_WRAPPERS = {}  # type: dict[Type, primitive_wrapper.PrimitiveWrapper]
+# reset() clears the dict in place, so this bound method never goes stale.
+_WRAPPERS_GET = _WRAPPERS.get
+
+
+def reset() -> None:
+  """Resets the registry."""
+  _KEY_MANAGERS.clear()
+  _WRAPPERS.clear()
+
+
+def _key_manager_internal(
+    type_url: Text) -> Tuple[km_module.KeyManager, bool, Type]:
+  """Returns the key manager, new_key_allowed, primitive class triple."""
+  val = _KEY_MANAGERS.get(type_url, _MISSING)
+  if val is _MISSING:
+    raise tink_error.TinkError(
+        'No manager for type {} has been registered.'.format(type_url))
+  return val
+
+
+def key_manager(type_url: Text) -> km_module.KeyManager:
+  """Returns a key manager for the given type_url and primitive_class.
+
+  Args:
+    type_url: Key type string
+
+  Returns:
+    A KeyManager object
+  """
+  return _key_manager_internal(type_url)[0]
+
+
+def register_key_manager(key_manager: km_module.KeyManager,
+                         new_key_allowed: bool = True) -> None:
+  """Tries to register a key_manager for the given key_manager.key_type().
+
+  Args:
+    key_manager: A KeyManager object
+    new_key_allowed: If new_key_allowed is true, users can generate new keys
+      with this manager using Registry.new_key()
+  """
+  type_url = key_manager.key_type()
+  primitive_class = key_manager.primitive_class()
+
+  if not key_manager.does_support(type_url):
+    raise tink_error.TinkError(
+        'The manager does not support its own type {}.'.format(type_url))
+
+  if type_url in _KEY_MANAGERS:
+    existing, existing_new_key, existing_class = _KEY_MANAGERS[type_url]
+    if (type(existing) is not type(key_manager) or  # pylint: disable=unidiomatic-typecheck
+        existing_class != primitive_class):
+      raise tink_error.TinkError(
+          'A manager for type {} has been already registered.'.format(
+              type_url))
+    else:
+      if not existing_new_key and new_key_allowed:
+        raise tink_error.TinkError(
+            ('A manager for type {} has been already registered '
+             'with forbidden new key operation.').format(type_url))
+      _KEY_MANAGERS[type_url] = (existing, new_key_allowed, existing_class)
+  else:
+    _KEY_MANAGERS[type_url] = (key_manager, new_key_allowed, primitive_class)
+
+
+def primitive(key_data: tink_pb2.KeyData, primitive_class: Type[P]) -> P:
+  """Creates a new primitive for the key given in key_data.
+
+  It looks up a KeyManager identified by key_data.type_url,
+  and calls manager's primitive(key_data) method.
+
+  Args:
+    key_data: KeyData object
+    primitive_class: The expected primitive class
+
+  Returns:
+    A primitive for the given key_data
+  Raises:
+    Error if primitive_class does not match the registered primitive class.
+  """
+  key_mgr, _, key_mgr_class = _key_manager_internal(key_data.type_url)
+  if key_mgr_class != primitive_class:
+    raise tink_error.TinkError(
+        'Wrong primitive class: type {} uses primitive {}, and not {}.'
+        .format(key_data.type_url, key_mgr_class.__name__,
+                primitive_class.__name__))
+  return key_mgr.primitive(key_data)
+
+
+def new_key_data(key_template: tink_pb2.KeyTemplate) -> tink_pb2.KeyData:
+  """Generates a new key for the specified key_template."""
+  key_mgr, new_key_allowed, _ = _key_manager_internal(key_template.type_url)
+
+  if not new_key_allowed:
+    raise tink_error.TinkError(
+        'KeyManager for type {} does not allow for creation of new keys.'
+        .format(key_template.type_url))
+
+  return key_mgr.new_key_data(key_template)
+
+
+def public_key_data(private_key_data: tink_pb2.KeyData) -> tink_pb2.KeyData:
+  """Generates a new key for the specified key_template."""
+  if (private_key_data.key_material_type !=
+      tink_pb2.KeyData.ASYMMETRIC_PRIVATE):
+    raise tink_error.TinkError('The keyset contains a non-private key')
+  key_mgr = key_manager(private_key_data.type_url)
+  if not isinstance(key_mgr, km_module.PrivateKeyManager):
+    raise tink_error.TinkError(
+        'manager for key type {} is not a PrivateKeyManager'
+        .format(private_key_data.type_url))
+  return key_mgr.public_key_data(private_key_data)
+
+
+def register_primitive_wrapper(
+    wrapper: primitive_wrapper.PrimitiveWrapper) -> None:
+  """Tries to register a PrimitiveWrapper.
+
+  Args:
+    wrapper: A PrimitiveWrapper object.
+  Raises:
+    Error if a different wrapper has already been registered for the same
+    Primitive.
+  """
+  primitive_class = wrapper.primitive_class()
+  if (primitive_class in _WRAPPERS and
+      type(_WRAPPERS[primitive_class]) is not type(wrapper)):  # pylint: disable=unidiomatic-typecheck
+    raise tink_error.TinkError(
+        'A wrapper for primitive {} has already been added.'.format(
+            primitive_class.__name__))
+  if _VALIDATE_WRAPPERS:
+    wrapped = wrapper.wrap(pset_module.PrimitiveSet(primitive_class))
+    if not isinstance(wrapped, primitive_class):
+      raise tink_error.TinkError(
+          'Wrapper for primitive {} generates incompatibe primitve of type {}'
+          .format(primitive_class.__name__, type(wrapped).__name__))
+  _WRAPPERS[primitive_class] = wrapper
+
+
+def wrap(primitive_set: pset_module.PrimitiveSet) -> Any:  # -> Primitive
+  """Tries to register a PrimitiveWrapper.
+
+  Args:
+    primitive_set: A PrimitiveSet object.
+  Returns:
+    A primitive that wraps the primitives in primitive_set.
+  Raises:
+    Error if no wrapper for this primitive class is registered.
+  """
+  primitive_class = primitive_set.primitive_class()
+  wrapper = _WRAPPERS_GET(primitive_class)
+  if wrapper is None:
+    raise tink_error.TinkError(
+        'No PrimitiveWrapper registered for primitive {}.'
+        .format(primitive_class.__name__))
+  return wrapper.wrap(primitive_set)
@@ -72,6 +72,10 @@ class PrimitiveSet(Generic[P]):
     # All raw keys have the same identifier, which is just b''.
     return self.primitive_from_identifier(crypto_format.RAW_PREFIX)
 
+  def all(self) -> List[List[Entry]]:
+    """Returns a copy of all lists of entries, one list per identifier."""
+    return [entries[:] for entries in self._primitives.values()]
+
   def add_primitive(self, primitive: P, key: tink_pb2.Keyset.Key) -> Entry:
     """Adds a new primitive and key entry to the set, and returns the entry."""
     if not isinstance(primitive, self._primitive_class):
@@ -165,6 +165,31 @@ class PrimitiveSetTest(absltest.TestCase):
     self.assertEqual(tink_pb2.DISABLED, entries[1].status)
     self.assertEqual(crypto_format.RAW_PREFIX, entries[1].identifier)
 
+  def test_all_returns_entries_grouped_by_identifier(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    fake_mac1 = helper.FakeMac('FakeMac1')
+    key1 = helper.fake_key(key_id=1)
+    primitive_set.add_primitive(fake_mac1, key1)
+    fake_mac2 = helper.FakeMac('FakeMac2')
+    primitive_set.add_primitive(
+        fake_mac2, helper.fake_key(key_id=2, output_prefix_type=tink_pb2.RAW))
+    fake_mac3 = helper.FakeMac('FakeMac3')
+    primitive_set.add_primitive(
+        fake_mac3, helper.fake_key(key_id=3, output_prefix_type=tink_pb2.RAW))
+
+    all_entries = sorted(primitive_set.all(), key=lambda l: l[0].identifier)
+    self.assertLen(all_entries, 2)
+    self.assertEqual(crypto_format.RAW_PREFIX, all_entries[0][0].identifier)
+    self.assertEqual([fake_mac2, fake_mac3],
+                     [e.primitive for e in all_entries[0]])
+    self.assertEqual(crypto_format.output_prefix(key1),
+                     all_entries[1][0].identifier)
+    self.assertEqual([fake_mac1], [e.primitive for e in all_entries[1]])
+
+  def test_all_of_empty_set_is_empty(self):
+    primitive_set = core.new_primitive_set(mac.Mac)
+    self.assertEqual(primitive_set.all(), [])
+
 
 if __name__ == '__main__':
   absltest.main()
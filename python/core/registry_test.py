@@ -20,6 +20,7 @@ from tink.proto import tink_pb2
 from tink.python import aead
 from tink.python import core
 from tink.python import mac
+from tink.python.core import _registry
 from tink.python.testing import helper
 
 
@@ -99,6 +100,12 @@ class RegistryTest(absltest.TestCase):
     self.reg = core.Registry()
     self.reg.reset()
 
+  def _set_validate_wrappers(self, value):
+    # pylint: disable=protected-access
+    original = _registry._VALIDATE_WRAPPERS
+    _registry._VALIDATE_WRAPPERS = value
+    self.addCleanup(setattr, _registry, '_VALIDATE_WRAPPERS', original)
+
   def test_key_manager_no_exist(self):
     with self.assertRaises(core.TinkError):
       self.reg.key_manager('invalid')
@@ -237,11 +244,18 @@ class RegistryTest(absltest.TestCase):
       self.reg.register_primitive_wrapper(DummyMacWrapper())
 
   def test_register_inconsistent_wrapper_fails(self):
+    self._set_validate_wrappers(True)
     with self.assertRaisesRegex(
         core.TinkError,
         'Wrapper for primitive Mac generates incompatibe primitve'):
       self.reg.register_primitive_wrapper(InconsistentWrapper())
 
+  def test_register_inconsistent_wrapper_without_validation(self):
+    self._set_validate_wrappers(False)
+    self.reg.register_primitive_wrapper(InconsistentWrapper())
+    self.assertIsInstance(
+        self.reg.wrap(_mac_set([helper.FakeMac()])), helper.FakeAead)
+
 
 if __name__ == '__main__':
   absltest.main()
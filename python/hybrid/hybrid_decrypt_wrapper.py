@@ -35,21 +35,36 @@ class _WrappedHybridDecrypt(hybrid_decrypt.HybridDecrypt):
   """Implements HybridDecrypt for a set of HybridDecrypt primitives."""
 
   def __init__(self, pset: primitive_set.PrimitiveSet):
-    self._primitive_set = pset
+    # Keysets are immutable once wrapped, so the entries can be looked up once.
+    # They hold only a handful of keys, so a linear startswith() scan over
+    # (prefix, entries) pairs beats slicing out the prefix and hashing it.
+    self._prefix_table = tuple(
+        (entries[0].identifier, tuple(entries))
+        for entries in pset.all()
+        if entries[0].identifier != crypto_format.RAW_PREFIX)
+    self._raw = tuple(pset.raw_primitives())
 
   def decrypt(self, ciphertext: bytes, context_info: bytes) -> bytes:
-    if len(ciphertext) > crypto_format.NON_RAW_PREFIX_SIZE:
-      prefix = ciphertext[:crypto_format.NON_RAW_PREFIX_SIZE]
-      ciphertext_no_prefix = ciphertext[crypto_format.NON_RAW_PREFIX_SIZE:]
-      for entry in self._primitive_set.primitive_from_identifier(prefix):
-        try:
-          return entry.primitive.decrypt(ciphertext_no_prefix,
-                                         context_info)
-        except tink_error.TinkError as e:
-          logging.info(
-              'ciphertext prefix matches a key, but cannot decrypt: %s', e)
+    # RAW-only keysets have an empty prefix table and go straight to RAW keys.
+    if (self._prefix_table and
+        len(ciphertext) > crypto_format.NON_RAW_PREFIX_SIZE):
+      for prefix, entries in self._prefix_table:
+        if ciphertext.startswith(prefix):
+          # Only copy the ciphertext body when some key matches the prefix.
+          ciphertext_no_prefix = ciphertext[
+              crypto_format.NON_RAW_PREFIX_SIZE:]
+          for entry in entries:
+            try:
+              return entry.primitive.decrypt(ciphertext_no_prefix,
+                                             context_info)
+            except tink_error.TinkError as e:
+              if logging.level_info():
+                logging.info(
+                    'ciphertext prefix matches a key, but cannot decrypt: %s',
+                    e)
+          break
     # Let's try all RAW keys.
-    for entry in self._primitive_set.raw_primitives():
+    for entry in self._raw:
       try:
         return entry.primitive.decrypt(ciphertext, context_info)
       except tink_error.TinkError as e:
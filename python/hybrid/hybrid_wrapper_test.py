@@ -21,6 +21,7 @@ from __future__ import print_function
 from absl.testing import absltest
 from tink.proto import tink_pb2
 from tink.python import core
+from tink.python.core import crypto_format
 from tink.python.hybrid import hybrid_decrypt
 from tink.python.hybrid import hybrid_decrypt_wrapper
 from tink.python.hybrid import hybrid_encrypt
@@ -136,6 +137,66 @@ class HybridWrapperTest(absltest.TestCase):
         wrapped_dec.decrypt(raw_ciphertext2, b'context_info2'),
         b'plaintext2')
 
+  def test_encrypt_decrypt_legacy_key(self):
+    dec, enc, dec_key, enc_key = new_primitives_and_keys(1234, tink_pb2.LEGACY)
+    dec_pset = core.new_primitive_set(hybrid_decrypt.HybridDecrypt)
+    dec_pset.set_primary(dec_pset.add_primitive(dec, dec_key))
+    wrapped_dec = hybrid_decrypt_wrapper.HybridDecryptWrapper().wrap(dec_pset)
+
+    enc_pset = core.new_primitive_set(hybrid_encrypt.HybridEncrypt)
+    enc_pset.set_primary(enc_pset.add_primitive(enc, enc_key))
+    wrapped_enc = hybrid_encrypt_wrapper.HybridEncryptWrapper().wrap(enc_pset)
+
+    ciphertext = wrapped_enc.encrypt(b'plaintext', b'context_info')
+    self.assertTrue(ciphertext.startswith(crypto_format.LEGACY_START_BYTE))
+    self.assertEqual(
+        wrapped_dec.decrypt(ciphertext, b'context_info'), b'plaintext')
+
+  def test_decrypt_falls_back_to_raw_when_prefixed_key_fails(self):
+    raw_dec, raw_enc, raw_dec_key, _ = new_primitives_and_keys(
+        1234, tink_pb2.RAW)
+    dec, _, dec_key, _ = new_primitives_and_keys(5678, tink_pb2.TINK)
+    # A RAW ciphertext that happens to start with the prefix of the TINK key.
+    plaintext = crypto_format.output_prefix(dec_key) + b'plaintext'
+    raw_ciphertext = raw_enc.encrypt(plaintext, b'context_info')
+
+    dec_pset = core.new_primitive_set(hybrid_decrypt.HybridDecrypt)
+    dec_pset.add_primitive(raw_dec, raw_dec_key)
+    dec_pset.set_primary(dec_pset.add_primitive(dec, dec_key))
+    wrapped_dec = hybrid_decrypt_wrapper.HybridDecryptWrapper().wrap(dec_pset)
+
+    self.assertEqual(
+        wrapped_dec.decrypt(raw_ciphertext, b'context_info'), plaintext)
+
+  def test_decrypt_raw_only_keyset_does_not_strip_prefix(self):
+    raw_dec, raw_enc, raw_dec_key, _ = new_primitives_and_keys(
+        1234, tink_pb2.RAW)
+    _, _, tink_key, _ = new_primitives_and_keys(1234, tink_pb2.TINK)
+    plaintext = crypto_format.output_prefix(tink_key) + b'plaintext'
+    raw_ciphertext = raw_enc.encrypt(plaintext, b'context_info')
+
+    dec_pset = core.new_primitive_set(hybrid_decrypt.HybridDecrypt)
+    dec_pset.set_primary(dec_pset.add_primitive(raw_dec, raw_dec_key))
+    wrapped_dec = hybrid_decrypt_wrapper.HybridDecryptWrapper().wrap(dec_pset)
+
+    self.assertEqual(
+        wrapped_dec.decrypt(raw_ciphertext, b'context_info'), plaintext)
+    unknown_ciphertext = helper.FakeHybridEncrypt('unknownHybrid').encrypt(
+        b'plaintext', b'context_info')
+    with self.assertRaisesRegex(core.TinkError, 'Decryption failed'):
+      wrapped_dec.decrypt(unknown_ciphertext, b'context_info')
+
+  def test_decrypt_short_ciphertext_without_raw_keys_fails(self):
+    dec, _, dec_key, _ = new_primitives_and_keys(1234, tink_pb2.TINK)
+    dec_pset = core.new_primitive_set(hybrid_decrypt.HybridDecrypt)
+    dec_pset.set_primary(dec_pset.add_primitive(dec, dec_key))
+    wrapped_dec = hybrid_decrypt_wrapper.HybridDecryptWrapper().wrap(dec_pset)
+
+    prefix = crypto_format.output_prefix(dec_key)
+    for ciphertext in [b'', prefix[:1], prefix]:
+      with self.assertRaisesRegex(core.TinkError, 'Decryption failed'):
+        wrapped_dec.decrypt(ciphertext, b'context_info')
+
   def test_decrypt_unknown_ciphertext_fails(self):
     unknown_enc = helper.FakeHybridEncrypt('unknownHybrid')
     unknown_ciphertext = unknown_enc.encrypt(b'plaintext', b'context_info')